@@ -13,9 +13,12 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
+import math
 import re
+import threading
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from json.decoder import JSONDecodeError
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union, cast
 
@@ -24,6 +27,11 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 from pyquil.api._config import PyquilConfig
 from pyquil.api._error_reporting import _record_call
 from pyquil.api._errors import (
@@ -60,12 +68,50 @@ def post_json(session: requests.Session, url: str, json: Any) -> requests.models
     Post JSON to the Forest endpoint.
     """
     logger.debug("Sending POST request to %s. Body: %s", url, json)
-    res = session.post(url, json=json)
+    data = _dumps_json(json)
+    if data is None:
+        res = session.post(url, json=json)
+    else:
+        res = session.post(url, data=data, headers={"Content-Type": "application/json"})
     if res.status_code >= 400:
         raise parse_error(res)
     return res
 
 
+def _dumps_json(obj: Any) -> Optional[bytes]:
+    """
+    Serialize a request body with orjson, if it is installed, which is much faster than the
+    standard library for large payloads such as long programs.
+
+    Bodies are handled exactly as they would be without orjson: anything orjson cannot encode
+    (such as numpy values), and bodies with ``NaN`` or infinite floats (which orjson would
+    silently encode as ``null``), are left to ``requests``.
+
+    :return: The encoded body, or None if orjson is unavailable or should not encode ``obj``, in
+        which case the caller should fall back to ``requests``' own JSON encoding.
+    """
+    if orjson is None or _has_non_finite_float(obj):
+        return None
+    try:
+        return orjson.dumps(obj)
+    except TypeError:
+        return None
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """
+    Whether a JSON-like object contains a ``NaN`` or infinite float. Strings, such as the text
+    of a program, are not scanned.
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in obj)
+    return False
+
+
 def parse_error(res: requests.Response) -> ApiError:
     """
     Every server error should contain a "status" field with a human readable explanation of
@@ -101,7 +147,12 @@ def get_session(*args: Any, **kwargs: Any) -> "ForestSession":
     :rtype: Session
     """
     session = ForestSession(*args, **kwargs)
+    # A session talks to a handful of hosts (QVM, Forest, dispatch), and may have several
+    # concurrent requests in flight to the QVM, e.g. from QVMConnection.run_programs. Keep enough
+    # connections per host pooled that none of them need to be re-established.
     retry_adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=64,
         max_retries=Retry(
             total=3,
             method_whitelist=["POST"],
@@ -142,6 +193,25 @@ def validate_noise_probabilities(noise_parameter: Optional[List[float]]) -> None
         raise ValueError("noise_parameter values should all be non-negative")
 
 
+def validate_qvm_config(
+    gate_noise: Optional[List[float]],
+    measurement_noise: Optional[List[float]],
+    random_seed: Optional[int],
+) -> None:
+    """
+    Validate the noise and seed arguments shared by the QVM constructors.
+
+    :param gate_noise: Gate noise probabilities, as accepted by ``validate_noise_probabilities``.
+    :param measurement_noise: Measurement noise probabilities, as accepted by
+        ``validate_noise_probabilities``.
+    :param random_seed: Either None or a non-negative integer.
+    """
+    validate_noise_probabilities(gate_noise)
+    validate_noise_probabilities(measurement_noise)
+    if random_seed is not None and not (isinstance(random_seed, int) and random_seed >= 0):
+        raise TypeError("random_seed should be None or a non-negative int")
+
+
 def validate_qubit_list(qubit_list: Sequence[int]) -> Sequence[int]:
     """
     Check the validity of qubits for the payload.
@@ -324,6 +394,11 @@ class ForestSession(requests.Session):
         self.headers.update(self.config.qcs_auth_headers)
         self.headers["User-Agent"] = f"PyQuil/{__version__}"
         self.lattice_name = lattice_name
+        # The session may be shared between threads (see ForestConnection._qvm_run_programs).
+        # Auth refreshes are serialized, and counted so that requests which failed with a
+        # credential that has since been refreshed by another thread do not refresh it again.
+        self._auth_refresh_lock = threading.Lock()
+        self._auth_refresh_count = 0
 
     def _engage(self) -> Optional["Engagement"]:
         """
@@ -411,6 +486,23 @@ class ForestSession(requests.Session):
             self._engagement = self._engage()
         return self._engagement
 
+    def _refresh_auth_token_once(self, refresh_count: int) -> bool:
+        """
+        Refresh the auth credential, unless another thread has already refreshed it since
+        ``refresh_count`` was read.
+
+        :param refresh_count: The value of ``_auth_refresh_count`` when the failed request was
+            sent.
+        :return: Whether there is a refreshed credential to retry the request with.
+        """
+        with self._auth_refresh_lock:
+            if self._auth_refresh_count != refresh_count:
+                return True
+            if not self._refresh_auth_token():
+                return False
+            self._auth_refresh_count += 1
+            return True
+
     def _refresh_auth_token(self) -> bool:
         self.config.assert_valid_auth_credential()
         if self.config.user_auth_token is not None:
@@ -466,9 +558,10 @@ class ForestSession(requests.Session):
         401 and 403 response statuses and refreshes the auth credential
         accordingly.
         """
+        refresh_count = self._auth_refresh_count
         response = super().request(*args, **kwargs)
         if response.status_code in {401, 403}:
-            if self._refresh_auth_token():
+            if self._refresh_auth_token_once(refresh_count):
                 response = super().request(*args, **kwargs)
         return response
 
@@ -497,13 +590,14 @@ class ForestSession(requests.Session):
         authentication token, we refresh the token to clear that error. Note that other error
         messages will not trigger a retry.
         """
+        refresh_count = self._auth_refresh_count
         result = self._request_graphql(*args, **kwargs)
         errors = result.get("errors", [])
         token_is_expired = any(
             error.get("extensions", {}).get("code") == "AUTH_TOKEN_EXPIRED" for error in errors
         )
         if token_is_expired:
-            if self._refresh_auth_token():
+            if self._refresh_auth_token_once(refresh_count):
                 result = self._request_graphql(*args, **kwargs)
         return result
 
@@ -539,6 +633,24 @@ class ForestConnection:
         self.forest_cloud_endpoint = forest_cloud_endpoint
         self.session = get_session(config=pyquil_config)
 
+        # Set once the QVM at sync_endpoint has been found to be running a compatible version,
+        # so that QVMs sharing this connection need not each check it again.
+        self._qvm_version_verified = False
+
+    def _mark_qvm_version_verified(self) -> None:
+        """
+        Record that the QVM at this connection's endpoint runs a compatible version, so that
+        QVMs connecting using this connection need not check it again.
+        """
+        self._qvm_version_verified = True
+
+    def _invalidate_qvm_version_cache(self) -> None:
+        """
+        Forget that the QVM version has been verified, so that it is checked again the next time
+        a QVM connects using this connection.
+        """
+        self._qvm_version_verified = False
+
     @_record_call
     def _run_and_measure(
         self, quil_program: Program, qubits: Sequence[int], trials: int, random_seed: int
@@ -603,9 +715,65 @@ class ForestConnection:
 
         Users should use :py:func:`QVM.run` instead of calling this directly.
         """
-        payload = qvm_run_payload(
-            quil_program, classical_addresses, trials, measurement_noise, gate_noise, random_seed
-        )
+        return self._qvm_run_programs(
+            [quil_program],
+            [classical_addresses],
+            trials,
+            measurement_noise,
+            gate_noise,
+            random_seed,
+        )[0]
+
+    @_record_call
+    def _qvm_run_programs(
+        self,
+        quil_programs: Sequence[Program],
+        classical_addresses: Sequence[Dict[str, Union[bool, Sequence[int]]]],
+        trials: int,
+        measurement_noise: Optional[Tuple[float, float, float]],
+        gate_noise: Optional[Tuple[float, float, float]],
+        random_seed: Optional[int],
+        num_workers: int = 1,
+    ) -> List[Dict[str, np.ndarray]]:
+        """
+        Run a batch of Forest ``run`` jobs on a QVM.
+
+        Every payload is built (and validated) before the first request is sent, and all of the
+        requests share this connection's session and its pool of kept-alive connections. With
+        ``num_workers > 1`` up to that many requests are in flight at once, so that the QVM can
+        work on one program while the results of another are being transferred and decoded.
+        If several of those requests are rejected with an expired credential, the session
+        refreshes it only once. If any request fails, the first error (in program order) is
+        raised once every in-flight request has finished.
+
+        Users should use :py:func:`QVMConnection.run_programs` instead of calling this directly.
+
+        :param num_workers: The maximum number of requests to have in flight at once.
+        :return: One dictionary of memory region buffers per program, in the order of
+            ``quil_programs``.
+        """
+        if num_workers < 1:
+            raise ValueError("num_workers must be a positive integer")
+        if len(quil_programs) != len(classical_addresses):
+            raise ValueError("quil_programs and classical_addresses must have the same length")
+
+        payloads = [
+            qvm_run_payload(
+                quil_program, addresses, trials, measurement_noise, gate_noise, random_seed
+            )
+            for quil_program, addresses in zip(quil_programs, classical_addresses)
+        ]
+
+        if num_workers == 1 or len(payloads) <= 1:
+            return [self._qvm_run_payload(payload) for payload in payloads]
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            return list(executor.map(self._qvm_run_payload, payloads))
+
+    def _qvm_run_payload(self, payload: Dict[str, object]) -> Dict[str, np.ndarray]:
+        """
+        Post a single ``multishot`` payload to the QVM and decode the returned memory.
+        """
         response = post_json(self.session, self.sync_endpoint + "/qvm", payload)
 
         ram = response.json()
@@ -613,7 +781,7 @@ class ForestConnection:
         for k in ram.keys():
             ram[k] = np.array(ram[k])
 
-        return ram
+        return cast(Dict[str, np.ndarray], ram)
 
     @_record_call
     def _qvm_get_version_info(self) -> str:
@@ -631,6 +799,46 @@ class ForestConnection:
         return qvm_version
 
 
+_default_connection: Optional[ForestConnection] = None
+_default_connection_lock = threading.Lock()
+
+
+def _get_default_connection() -> ForestConnection:
+    """
+    Return a process-wide :py:class:`ForestConnection` built from the default configuration.
+
+    Callers that are not handed an explicit connection should use this rather than constructing
+    a fresh ``ForestConnection()``, so that they share a single HTTP session (and its pool of
+    kept-alive connections) instead of paying for new TCP/TLS handshakes on every object.
+
+    The configuration is read again on every call, and the connection is rebuilt whenever the
+    QVM, quilc or Forest URL it was built with no longer matches, e.g. after ``QVM_URL`` has been
+    changed.
+    """
+    global _default_connection
+    pyquil_config = PyquilConfig()
+    with _default_connection_lock:
+        connection = _default_connection
+        if (
+            connection is None
+            or connection.sync_endpoint != pyquil_config.qvm_url
+            or connection.compiler_endpoint != pyquil_config.quilc_url
+            or connection.forest_cloud_endpoint != pyquil_config.forest_url
+        ):
+            connection = _default_connection = ForestConnection()
+        return connection
+
+
+def _reset_default_connection() -> None:
+    """
+    Discard the process-wide default connection, so that the next call to
+    :py:func:`_get_default_connection` builds a new one from the current configuration.
+    """
+    global _default_connection
+    with _default_connection_lock:
+        _default_connection = None
+
+
 class Engagement:
     """
     An Engagement stores all the information retrieved via an engagement request sent to
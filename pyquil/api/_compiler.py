@@ -16,6 +16,7 @@
 import logging
 import sys
 import warnings
+import weakref
 from requests.exceptions import RequestException
 from typing import Dict, Any, List, Optional, Tuple, Union, cast
 from collections import Counter
@@ -54,6 +55,18 @@ _log = logging.getLogger(__name__)
 PYQUIL_PROGRAM_PROPERTIES = ["native_quil_metadata", "num_shots"]
 
 
+def _close_client(client: Client) -> None:
+    """
+    Close the sockets of an rpcq Client. Used as a ``weakref.finalize`` callback, so it may run
+    during interpreter shutdown, when closing can fail; only errors raised then are ignored.
+    """
+    try:
+        client.close()  # type: ignore
+    except Exception:
+        if not sys.is_finalizing():
+            raise
+
+
 class QuilcVersionMismatch(Exception):
     pass
 
@@ -226,9 +239,11 @@ class QPUCompiler(AbstractCompiler):
             )
 
         self.quilc_client = Client(_quilc_endpoint, timeout=timeout)
+        self._quilc_client_finalizer = weakref.finalize(self, _close_client, self.quilc_client)
 
         self.qpu_compiler_endpoint = qpu_compiler_endpoint
         self._qpu_compiler_client: Optional[Union[Client, HTTPCompilerClient]] = None
+        self._qpu_compiler_client_finalizer: Optional[weakref.finalize] = None
 
         self._device = device
         td = TargetDevice(isa=device.get_isa().to_dict(), specs=None)  # type: ignore
@@ -262,6 +277,9 @@ class QPUCompiler(AbstractCompiler):
                     )
                 elif endpoint.startswith("tcp://"):
                     self._qpu_compiler_client = Client(endpoint, timeout=self.timeout)
+                    self._qpu_compiler_client_finalizer = weakref.finalize(
+                        self, _close_client, self._qpu_compiler_client
+                    )
                 else:
                     raise UserMessageError(
                         "Invalid endpoint provided to QPUCompiler. Expected protocol in [http://, "
@@ -358,6 +376,9 @@ class QPUCompiler(AbstractCompiler):
         """
         Reset the state of the QPUCompiler Client connections.
         """
+        if self._qpu_compiler_client_finalizer is not None:
+            self._qpu_compiler_client_finalizer()
+            self._qpu_compiler_client_finalizer = None
         self._qpu_compiler_client = None
 
 
@@ -384,6 +405,7 @@ class QVMCompiler(AbstractCompiler):
 
         self.endpoint = endpoint
         self.client = Client(endpoint, timeout=timeout)
+        self._client_finalizer = weakref.finalize(self, _close_client, self.client)
         td = TargetDevice(isa=device.get_isa().to_dict(), specs=None)  # type: ignore
         self.target_device = td
 
@@ -425,8 +447,9 @@ class QVMCompiler(AbstractCompiler):
         Reset the state of the QVMCompiler quilc connection.
         """
         timeout = self.client.timeout
-        self.client.close()  # type: ignore
+        self._client_finalizer()
         self.client = Client(self.endpoint, timeout=timeout)
+        self._client_finalizer = weakref.finalize(self, _close_client, self.client)
 
 
 @dataclass
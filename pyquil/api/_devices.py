@@ -17,7 +17,12 @@ from typing import Dict, List, Optional, cast
 
 from requests.exceptions import MissingSchema
 
-from pyquil.api._base_connection import get_json, get_session, ForestConnection
+from pyquil.api._base_connection import (
+    get_json,
+    get_session,
+    ForestConnection,
+    _get_default_connection,
+)
 from pyquil.api._config import PyquilConfig
 from pyquil.device._main import Device
 
@@ -43,7 +48,7 @@ def list_devices(connection: Optional[ForestConnection] = None) -> List[str]:
     #   "noise_model": a NoiseModel object describing the entire device, serialized as a dictionary
     # }
     if connection is None:
-        connection = ForestConnection()
+        connection = _get_default_connection()
 
     session = connection.session
     assert connection.forest_cloud_endpoint is not None
@@ -69,7 +74,7 @@ def list_lattices(
             }
     """
     if connection is None:
-        connection = ForestConnection()
+        connection = _get_default_connection()
     session = connection.session
     assert connection.forest_cloud_endpoint is not None
     url = connection.forest_cloud_endpoint + "/lattices"
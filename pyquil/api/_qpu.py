@@ -104,6 +104,7 @@ class QPU(QAM):
         self._client: Optional[Client] = None
         self._client_engagement: Optional[Engagement] = None
         self._last_results: Dict[str, np.ndarray] = {}
+        self._job_id: Optional[str] = None
 
         super().__init__()
 
@@ -186,13 +187,7 @@ support at support@rigetti.com."""
     @_record_call
     def run(self, run_priority: Optional[int] = None) -> "QPU":
         """
-        Run a pyquil program on the QPU.
-
-        This formats the classified data from the QPU server by stacking measured bits into
-        an array of shape (trials, classical_addresses). The mapping of qubit to
-        classical address is backed out from MEASURE instructions in the program, so
-        only do measurements where there is a 1-to-1 mapping between qubits and classical
-        addresses.
+        Submit a pyquil program to the QPU. Use :py:func:`wait` to collect the results.
 
         :param run_priority: The priority with which to insert jobs into the QPU queue. Lower
                              integers correspond to higher priority. If not specified, the QPU
@@ -208,6 +203,11 @@ support at support@rigetti.com."""
                 " is expected. Please use QuantumComputer.compile() to compile"
                 " your program."
             )
+        if self._job_id is not None:
+            warnings.warn(
+                f"Job {self._job_id} was submitted but never waited on. Its results will be "
+                "discarded. Call wait() after each run() to collect them."
+            )
         super().run()
 
         assert self._executable is not None
@@ -218,10 +218,37 @@ support at support@rigetti.com."""
         )
 
         job_priority = run_priority if run_priority is not None else self.priority
-        job_id = self.client.call(
+        self._job_id = self.client.call(
             "execute_qpu_request", request=request, user=self.user, priority=job_priority
         )
-        results = self._get_buffers(job_id)
+
+        return self
+
+    @_record_call
+    def wait(self) -> "QPU":
+        """
+        Block until the job submitted by :py:func:`run` has finished, and collect its results.
+
+        The results are fetched with a single ``get_buffers`` request that the QPU server holds
+        open until the job completes, so there is no client-side polling. Since :py:func:`run`
+        returns as soon as the job has been queued, any classical work done between ``run()`` and
+        ``wait()`` overlaps with execution on the QPU.
+
+        The classified data from the QPU server is formatted by stacking measured bits into
+        an array of shape (trials, classical_addresses). The mapping of qubit to
+        classical address is backed out from MEASURE instructions in the program, so
+        only do measurements where there is a 1-to-1 mapping between qubits and classical
+        addresses.
+
+        :return: The QPU object itself.
+        """
+        assert self._job_id is not None
+        assert self._executable is not None
+        try:
+            results = self._get_buffers(self._job_id)
+        finally:
+            # The job has been waited on even if it failed, so it is not outstanding any more.
+            self._job_id = None
         ro_sources = self._executable.ro_sources  # type: ignore
 
         if results:
@@ -240,11 +267,11 @@ support at support@rigetti.com."""
         self._memory_results["ro"] = bitstrings
         self._last_results = results
 
-        return self
+        return cast("QPU", super().wait())
 
     def _get_buffers(self, job_id: str) -> Dict[str, np.ndarray]:
         """
-        Return the decoded result buffers for particular job_id.
+        Return the decoded result buffers for particular job_id, blocking until they are ready.
 
         :param job_id: Unique identifier for the job in question
         :return: Decoded buffers or throw an error
@@ -387,3 +414,4 @@ support at support@rigetti.com."""
         super().reset()
 
         self._client = None
+        self._job_id = None
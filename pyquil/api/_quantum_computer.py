@@ -27,7 +27,7 @@ import networkx as nx
 import numpy as np
 from rpcq.messages import BinaryExecutableResponse, PyQuilExecutableResponse
 
-from pyquil.api._base_connection import ForestConnection, get_session
+from pyquil.api._base_connection import ForestConnection, _get_default_connection, get_session
 from pyquil.api._compiler import QPUCompiler, QVMCompiler
 from pyquil.api._config import PyquilConfig
 from pyquil.api._devices import get_lattice, list_lattices
@@ -516,7 +516,7 @@ def list_quantum_computers(
     :param qvms: Whether to include QVM's in the list.
     """
     if connection is None:
-        connection = ForestConnection()
+        connection = _get_default_connection()
 
     qc_names: List[str] = []
     if qpus:
@@ -642,7 +642,7 @@ def _get_qvm_qc(
     :return: A QuantumComputer backed by a QVM with the above options.
     """
     if connection is None:
-        connection = ForestConnection()
+        connection = _get_default_connection()
 
     return QuantumComputer(
         name=name,
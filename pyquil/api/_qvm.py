@@ -13,6 +13,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
+import functools
+import re
 import warnings
 import numpy as np
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union, cast
@@ -22,7 +24,7 @@ from rpcq.messages import PyQuilExecutableResponse
 
 from pyquil.api._base_connection import (
     validate_qubit_list,
-    validate_noise_probabilities,
+    validate_qvm_config,
     TYPE_MULTISHOT_MEASURE,
     TYPE_WAVEFUNCTION,
     TYPE_EXPECTATION,
@@ -51,13 +53,23 @@ class QVMNotRunning(Exception):
     pass
 
 
+_QVM_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)")
+
+
+@functools.lru_cache(maxsize=32)
 def check_qvm_version(version: str) -> None:
     """
     Verify that there is no mismatch between pyquil and QVM versions.
 
+    Only the leading ``major.minor.patch`` of the version is considered, so pre-release versions
+    such as ``1.17.0-rc1`` are accepted.
+
     :param version: The version of the QVM
     """
-    major, minor, patch = map(int, version.split("."))
+    match = _QVM_VERSION_RE.match(version)
+    if match is None:
+        raise QVMVersionMismatch(f"Unable to parse QVM version {version!r}")
+    major, minor, _ = map(int, match.groups())
     if major == 1 and minor < 8:
         raise QVMVersionMismatch(
             "Must use QVM >= 1.8.0 with pyquil >= 2.8.0, but you "
@@ -65,6 +77,53 @@ def check_qvm_version(version: str) -> None:
         )
 
 
+def _connect_to_qvm(connection: ForestConnection) -> None:
+    """
+    Verify that a QVM is running at the connection's endpoint, and that its version is
+    compatible with this version of pyQuil.
+
+    The check is only performed the first time this is called for a given connection.
+
+    :param connection: The connection to the QVM.
+    """
+    if connection._qvm_version_verified:
+        return
+    try:
+        version = cast(str, connection._qvm_get_version_info())
+        check_qvm_version(version)
+    except ConnectionError:
+        raise QVMNotRunning(f"No QVM server running at {connection.sync_endpoint}")
+    connection._mark_qvm_version_verified()
+
+
+def _get_cached_classical_addresses(quil_program: Program) -> Dict[str, List[int]]:
+    """
+    Return the classical addresses measured into by a program, as computed by
+    :py:func:`get_classical_addresses_from_program`.
+
+    The result is memoized on the program and reused until the program is modified, so that
+    re-submitting the same program (e.g. with different parameter values) does not walk its
+    instructions again every time. Modifications through the :py:class:`Program` API, and
+    instructions appended to or removed from ``quil_program.instructions``, are detected;
+    replacing an item of ``quil_program.instructions`` in place is not.
+
+    :param quil_program: The program from which to get the classical addresses.
+    :return: A mapping from memory region names to lists of offsets appearing in the program.
+    """
+    if not isinstance(quil_program, Program):
+        raise TypeError("quil_program must be a Quil program object")
+
+    instructions = quil_program.instructions
+    # Programs unpickled from an earlier pyQuil do not have the attribute.
+    cached = getattr(quil_program, "_classical_addresses", None)
+    if cached is None or cached[0] is not instructions or cached[1] != len(instructions):
+        addresses = get_classical_addresses_from_program(quil_program)
+        cached = (instructions, len(instructions), addresses)
+        quil_program._classical_addresses = cached
+    # Hand out a shallow copy: callers are free to canonicalize the dictionary in place.
+    return dict(cached[2])
+
+
 class QVMConnection(object):
     """
     Represents a connection to the QVM.
@@ -129,28 +188,17 @@ programs run on this QVM.
 
         self.sync_endpoint = endpoint
 
-        validate_noise_probabilities(gate_noise)
-        validate_noise_probabilities(measurement_noise)
+        validate_qvm_config(gate_noise, measurement_noise, random_seed)
         self.gate_noise = gate_noise
         self.measurement_noise = measurement_noise
-
-        if random_seed is None:
-            self.random_seed = None
-        elif isinstance(random_seed, int) and random_seed >= 0:
-            self.random_seed = random_seed
-        else:
-            raise TypeError("random_seed should be None or a non-negative int")
+        self.random_seed = random_seed
 
         self._connection = ForestConnection(sync_endpoint=endpoint)
         self.session = self._connection.session  # backwards compatibility
         self.connect()
 
     def connect(self) -> None:
-        try:
-            version_dict = self.get_version_info()
-            check_qvm_version(version_dict)
-        except ConnectionError:
-            raise QVMNotRunning(f"No QVM server running at {self._connection.sync_endpoint}")
+        _connect_to_qvm(self._connection)
 
     @_record_call
     def get_version_info(self) -> str:
@@ -182,7 +230,7 @@ programs run on this QVM.
             `classical_addresses`.
         """
         if classical_addresses is None:
-            caddresses: Mapping[str, Sequence[int]] = get_classical_addresses_from_program(
+            caddresses: Mapping[str, Sequence[int]] = _get_cached_classical_addresses(
                 quil_program
             )
 
@@ -198,6 +246,42 @@ programs run on this QVM.
             self.random_seed,
         )
 
+        return self._ro_bitstrings(buffers)
+
+    @_record_call
+    def run_programs(
+        self, quil_programs: Sequence[Program], trials: int = 1, num_workers: int = 1
+    ) -> List[List[List[int]]]:
+        """
+        Run several Quil programs multiple times each, accumulating the values deposited in
+        their ``ro`` readout registers.
+
+        This is equivalent to calling :py:func:`run` (without ``classical_addresses``) once per
+        program, except that every program is validated before any of them is sent to the QVM,
+        and that up to ``num_workers`` programs may be submitted concurrently.
+
+        :param quil_programs: A sequence of Quil programs.
+        :param trials: Number of shots to collect for each program.
+        :param num_workers: The maximum number of programs to have running on the QVM at once.
+        :return: A list with one entry per program, in the same order as ``quil_programs``. Each
+            entry is a list of lists of bits, as returned by :py:func:`run`.
+        """
+        caddresses = [_get_cached_classical_addresses(p) for p in quil_programs]
+
+        all_buffers = self._connection._qvm_run_programs(
+            quil_programs,
+            caddresses,
+            trials,
+            self.measurement_noise,
+            self.gate_noise,
+            self.random_seed,
+            num_workers=num_workers,
+        )
+
+        return [self._ro_bitstrings(buffers) for buffers in all_buffers]
+
+    @staticmethod
+    def _ro_bitstrings(buffers: Dict[str, np.ndarray]) -> List[List[int]]:
         if len(buffers) == 0:
             return []
         if "ro" in buffers:
@@ -472,27 +556,16 @@ http://pyquil.readthedocs.io/en/latest/noise_models.html#support-for-noisy-gates
         self.noise_model = noise_model
         self.connection = connection
 
-        validate_noise_probabilities(gate_noise)
-        validate_noise_probabilities(measurement_noise)
+        validate_qvm_config(gate_noise, measurement_noise, random_seed)
         self.gate_noise = gate_noise
         self.measurement_noise = measurement_noise
-
-        if random_seed is None:
-            self.random_seed = None
-        elif isinstance(random_seed, int) and random_seed >= 0:
-            self.random_seed = random_seed
-        else:
-            raise TypeError("random_seed should be None or a non-negative int")
+        self.random_seed = random_seed
 
         self.requires_executable = requires_executable
         self.connect()
 
     def connect(self) -> None:
-        try:
-            version_dict = self.get_version_info()
-            check_qvm_version(version_dict)
-        except ConnectionError:
-            raise QVMNotRunning(f"No QVM server running at {self.connection.sync_endpoint}")
+        _connect_to_qvm(self.connection)
 
     @_record_call
     def get_version_info(self) -> str:
@@ -558,7 +631,7 @@ http://pyquil.readthedocs.io/en/latest/noise_models.html#support-for-noisy-gates
 
         quil_program = self._executable
         trials = quil_program.num_shots
-        classical_addresses = get_classical_addresses_from_program(quil_program)
+        classical_addresses = _get_cached_classical_addresses(quil_program)
 
         if self.noise_model is not None:
             quil_program = apply_noise_model(quil_program, self.noise_model)
@@ -580,12 +653,16 @@ http://pyquil.readthedocs.io/en/latest/noise_models.html#support-for-noisy-gates
         return self
 
     def augment_program_with_memory_values(self, quil_program: Program) -> Program:
+        # Every value staged by write_memory since the last run is sent along with the program
+        # as a MOVE, so any number of writes costs no extra requests. Build the instruction list
+        # directly instead of adding the MOVEs and the program one instruction at a time.
         p = Program()
-
-        for k, v in self._variables_shim.items():
-            p += MOVE(MemoryReference(name=k.name, offset=k.index), v)
-
-        p += quil_program
+        p._instructions = [
+            MOVE(MemoryReference(name=k.name, offset=k.index), v)
+            for k, v in self._variables_shim.items()
+        ]
+        p._instructions.extend(quil_program._instructions)
+        p._defined_gates = list(quil_program._defined_gates)
 
         return percolate_declares(p)
 
@@ -18,7 +18,7 @@ from warnings import warn
 
 import numpy as np
 
-from pyquil.api._base_connection import ForestConnection
+from pyquil.api._base_connection import ForestConnection, _get_default_connection
 from pyquil.api._error_reporting import _record_call
 from pyquil.paulis import PauliSum, PauliTerm
 from pyquil.quil import Program, percolate_declares
@@ -40,7 +40,7 @@ class WavefunctionSimulator:
             an automatically generated seed) or a non-negative integer.
         """
         if connection is None:
-            connection = ForestConnection()
+            connection = _get_default_connection()
 
         self.connection = connection
 
@@ -1,8 +1,19 @@
+import math
+
+import numpy as np
 import pytest
+import requests
 import requests_mock
 import urllib.parse
 
-from pyquil.api._base_connection import ForestSession
+from pyquil.api import _base_connection
+from pyquil.api._base_connection import (
+    ForestSession,
+    _get_default_connection,
+    _reset_default_connection,
+    get_session,
+    post_json,
+)
 from pyquil.api._config import PyquilConfig
 from pyquil.api._errors import UserMessageError
 from pyquil.tests.utils import api_fixture_path
@@ -208,6 +219,28 @@ def test_forest_session_request_refresh_qmi_auth_token():
     assert devices[0]["id"] == 0
 
 
+def test_forest_session_refreshes_auth_token_once(monkeypatch):
+    session = ForestSession(config=PyquilConfig(TEST_CONFIG_PATHS))
+    refreshes = []
+
+    def refresh_auth_token():
+        refreshes.append(True)
+        return True
+
+    monkeypatch.setattr(session, "_refresh_auth_token", refresh_auth_token)
+
+    # Two requests sent with the same credential both fail; only the first refreshes it, and
+    # the second retries with the refreshed credential.
+    refresh_count = session._auth_refresh_count
+    assert session._refresh_auth_token_once(refresh_count)
+    assert session._refresh_auth_token_once(refresh_count)
+    assert len(refreshes) == 1
+
+    # A request that fails after the refresh refreshes again.
+    assert session._refresh_auth_token_once(session._auth_refresh_count)
+    assert len(refreshes) == 2
+
+
 def test_forest_session_request_engagement():
     """
     The QPU Endpoint address provided by engagement should be available to the
@@ -298,3 +331,74 @@ def test_forest_session_request_engagement_failure():
 
     with pytest.raises(UserMessageError):
         assert config.qpu_url is None
+
+
+def test_default_connection_is_shared(monkeypatch):
+    monkeypatch.setattr(_base_connection, "PyquilConfig", lambda: PyquilConfig(TEST_CONFIG_PATHS))
+    monkeypatch.setattr(_base_connection, "_default_connection", None)
+    monkeypatch.delenv("QVM_URL", raising=False)
+    connection = _get_default_connection()
+    assert _get_default_connection() is connection
+    assert _get_default_connection().session is connection.session
+
+    # A change to the configured endpoints is picked up.
+    monkeypatch.setenv("QVM_URL", "http://other-qvm:5000")
+    other_connection = _get_default_connection()
+    assert other_connection is not connection
+    assert other_connection.sync_endpoint == "http://other-qvm:5000"
+    assert _get_default_connection() is other_connection
+
+    _reset_default_connection()
+    assert _base_connection._default_connection is None
+    assert _get_default_connection() is not connection
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_post_json(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(_base_connection, "orjson", None)
+    session = requests.Session()
+    mock_adapter = requests_mock.Adapter()
+    session.mount("mock", mock_adapter)
+    mock_adapter.register_uri("POST", "mock://qvm/", status_code=200, json={})
+
+    payload = {"type": "multishot", "addresses": {"ro": [0, 1]}, "trials": 10}
+    post_json(session, "mock://qvm/", payload)
+    request = mock_adapter.last_request
+    assert request.headers["Content-Type"].startswith("application/json")
+    assert request.json() == {"type": "multishot", "addresses": {"ro": [0, 1]}, "trials": 10}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_post_json_numpy(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(_base_connection, "orjson", None)
+    session = requests.Session()
+    mock_adapter = requests_mock.Adapter()
+    session.mount("mock", mock_adapter)
+    mock_adapter.register_uri("POST", "mock://qvm/", status_code=200, json={})
+
+    # Whether or not orjson is installed, numpy floats are accepted and other numpy values are
+    # not.
+    post_json(session, "mock://qvm/", {"gate-noise": [np.float64(0.1), 0.0, 0.0]})
+    assert mock_adapter.last_request.json() == {"gate-noise": [0.1, 0.0, 0.0]}
+    with pytest.raises(TypeError):
+        post_json(session, "mock://qvm/", {"addresses": {"ro": np.arange(2)}})
+
+
+def test_dumps_json_leaves_non_finite_floats_to_requests():
+    # orjson would encode these as null; requests must see them as it would without orjson.
+    assert _base_connection._dumps_json({"gate-noise": [math.nan, 0.0, 0.0]}) is None
+    assert _base_connection._dumps_json({"measurement-noise": (0.0, math.inf, 0.0)}) is None
+    assert _base_connection._dumps_json({"gate-noise": [0.1, 0.0, 0.0]}) is not None
+    # Program text is not mistaken for a non-finite float.
+    assert _base_connection._dumps_json({"compiled-quil": "DECLARE nullspace REAL\n"}) is not None
+
+
+def test_get_session_pools_connections():
+    session = get_session(config=PyquilConfig(TEST_CONFIG_PATHS))
+    for prefix in ("http://", "https://"):
+        adapter = session.get_adapter(prefix + "mock-qvm:5000")
+        assert adapter._pool_connections == 8
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 3
@@ -1,3 +1,4 @@
+import gc
 import math
 import pytest
 import requests_mock
@@ -5,8 +6,9 @@ import requests_mock
 from rpcq.core_messages import BinaryExecutableResponse
 
 from pyquil import Program
+from pyquil.api import _compiler
 from pyquil.api._base_connection import get_session
-from pyquil.api._compiler import QPUCompiler
+from pyquil.api._compiler import QPUCompiler, QVMCompiler
 from pyquil.api._config import PyquilConfig
 from pyquil.api._errors import UserMessageError
 from pyquil.device import Device
@@ -152,3 +154,47 @@ def test_invalid_protocol():
             device=device,
             session=session,
         )
+
+
+class MockRPCQClient:
+    def __init__(self, endpoint, timeout=None):
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.closed = False
+
+    def call(self, method_name, *args, **kwargs):
+        assert method_name == "get_version_info"
+        return {"quilc": "1.20.0"}
+
+    def close(self):
+        self.closed = True
+
+
+def test_qvm_compiler_closes_client(monkeypatch):
+    monkeypatch.setattr(_compiler, "Client", MockRPCQClient)
+    device = Device(name="not_actually_device_name", raw={"isa": DUMMY_ISA_DICT})
+    compiler = QVMCompiler(endpoint="tcp://127.0.0.1:5555", device=device, timeout=1)
+
+    old_client = compiler.client
+    compiler.reset()
+    assert old_client.closed
+    new_client = compiler.client
+    assert not new_client.closed
+    assert new_client.timeout == 1
+
+    del compiler
+    gc.collect()
+    assert new_client.closed
+
+
+def test_qvm_compiler_reset_raises_close_errors(monkeypatch):
+    class FailingRPCQClient(MockRPCQClient):
+        def close(self):
+            raise RuntimeError("close failed")
+
+    monkeypatch.setattr(_compiler, "Client", FailingRPCQClient)
+    device = Device(name="not_actually_device_name", raw={"isa": DUMMY_ISA_DICT})
+    compiler = QVMCompiler(endpoint="tcp://127.0.0.1:5555", device=device, timeout=1)
+
+    with pytest.raises(RuntimeError, match="close failed"):
+        compiler.reset()
@@ -108,6 +108,13 @@ class Program(object):
         # method.  It is marked as None whenever new instructions are added.
         self._synthesized_instructions: Optional[List[AbstractInstruction]] = None
 
+        # Cache for the classical addresses measured into by this program, used when submitting
+        # it to the QVM. It is keyed on the identity and length of _synthesized_instructions, and
+        # so becomes stale whenever instructions are added.
+        self._classical_addresses: Optional[
+            Tuple[List[AbstractInstruction], int, Dict[str, List[int]]]
+        ] = None
+
         self.inst(*instructions)
 
         # Filled in with quil_to_native_quil
@@ -1085,16 +1092,19 @@ def percolate_declares(program: Program) -> Program:
     :param program: Perhaps jumbled program.
     :return: Program with DECLAREs all at the top and otherwise the same sorted contents.
     """
-    declare_program = Program()
-    instrs_program = Program()
+    declarations: List[AbstractInstruction] = []
+    instructions: List[AbstractInstruction] = []
 
     for instr in program:
         if isinstance(instr, Declare):
-            declare_program += instr
+            declarations.append(instr)
         else:
-            instrs_program += instr
+            instructions.append(instr)
 
-    p = declare_program + instrs_program
+    # The instructions have already been synthesized and type-checked by ``program``, so we can
+    # build the new program's instruction list directly rather than re-adding them one by one.
+    p = Program()
+    p._instructions = declarations + instructions
     p._defined_gates = program._defined_gates
 
     return p
@@ -37,8 +37,10 @@ from pyquil.api import QVMConnection, QPUCompiler, get_qc, QVMCompiler
 from pyquil.api._base_connection import (
     validate_noise_probabilities,
     validate_qubit_list,
+    validate_qvm_config,
     prepare_register_list,
 )
+from pyquil.api._errors import QVMError
 from pyquil.device import ISA, NxDevice
 from pyquil.gates import CNOT, H, MEASURE, PHASE, Z, RZ, RX, CZ
 from pyquil.paulis import PauliTerm
@@ -102,6 +104,75 @@ def test_sync_run_mock(qvm: QVMConnection):
         mock_qvm.run(EMPTY_PROGRAM)
 
 
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_sync_run_programs_mock(qvm: QVMConnection, num_workers: int):
+    mock_qvm = qvm
+    mock_endpoint = mock_qvm.sync_endpoint
+    programs = [BELL_STATE_MEASURE, Program(Declare("ro", "BIT"), MEASURE(0, ("ro", 0)))]
+
+    def mock_response(request, context):
+        payload = json.loads(request.text)
+        assert payload["type"] == "multishot"
+        assert payload["trials"] == 2
+        if payload["addresses"] == {"ro": [0, 1]}:
+            return '{"ro": [[0,0],[1,1]]}'
+        assert payload["addresses"] == {"ro": [0]}
+        return '{"ro": [[0],[0]]}'
+
+    with requests_mock.Mocker() as m:
+        m.post(mock_endpoint + "/qvm", text=mock_response)
+        results = mock_qvm.run_programs(programs, trials=2, num_workers=num_workers)
+        assert results == [[[0, 0], [1, 1]], [[0], [0]]]
+        assert m.call_count == 2
+
+        # An invalid program should fail before anything is sent to the QVM.
+        with pytest.raises(ValueError):
+            mock_qvm.run_programs([BELL_STATE_MEASURE, EMPTY_PROGRAM])
+        assert m.call_count == 2
+
+
+def _measure_n_program(n: int) -> Program:
+    return Program(Declare("ro", "BIT", n), [MEASURE(i, ("ro", i)) for i in range(n)])
+
+
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_sync_run_programs_more_programs_than_workers_mock(qvm: QVMConnection, num_workers: int):
+    mock_qvm = qvm
+    mock_endpoint = mock_qvm.sync_endpoint
+    programs = [_measure_n_program(n) for n in range(1, 9)]
+
+    def mock_response(request, context):
+        # Finish the programs out of order, so that the results have to be put back in order.
+        n = len(json.loads(request.text)["addresses"]["ro"])
+        time.sleep(0.01 * (9 - n))
+        return json.dumps({"ro": [[n] * n]})
+
+    with requests_mock.Mocker() as m:
+        m.post(mock_endpoint + "/qvm", text=mock_response)
+        results = mock_qvm.run_programs(programs, trials=1, num_workers=num_workers)
+        assert results == [[[n] * n] for n in range(1, 9)]
+        assert m.call_count == len(programs)
+
+
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_sync_run_programs_error_mock(qvm: QVMConnection, num_workers: int):
+    mock_qvm = qvm
+    mock_endpoint = mock_qvm.sync_endpoint
+    programs = [_measure_n_program(n) for n in range(1, 6)]
+
+    def mock_response(request, context):
+        n = len(json.loads(request.text)["addresses"]["ro"])
+        if n == 3:
+            context.status_code = 400
+            return json.dumps({"error_type": "qvm_error", "status": "program 3 failed"})
+        return json.dumps({"ro": [[n] * n]})
+
+    with requests_mock.Mocker() as m:
+        m.post(mock_endpoint + "/qvm", text=mock_response)
+        with pytest.raises(QVMError, match="program 3 failed"):
+            mock_qvm.run_programs(programs, trials=1, num_workers=num_workers)
+
+
 def test_sync_run(qvm: QVMConnection):
     assert qvm.run(BELL_STATE_MEASURE, [0, 1], trials=2) == [[0, 0], [1, 1]]
 
@@ -248,6 +319,18 @@ def test_validate_noise_probabilities():
         validate_noise_probabilities([-0.5, -0.5, -0.5])
 
 
+def test_validate_qvm_config():
+    validate_qvm_config(None, [0.1, 0.0, 0.0], 0)
+    with pytest.raises(ValueError):
+        validate_qvm_config([0.5, 0.5, 0.5], None, None)
+    with pytest.raises(TypeError):
+        validate_qvm_config(None, ["a", "b", "c"], None)
+    with pytest.raises(TypeError):
+        validate_qvm_config(None, None, -1)
+    with pytest.raises(TypeError):
+        validate_qvm_config(None, None, 1.5)
+
+
 def test_validate_qubit_list():
     with pytest.raises(TypeError):
         validate_qubit_list([-1, 1])
@@ -2,7 +2,7 @@ import networkx as nx
 import numpy as np
 import pytest
 
-from rpcq.messages import ParameterAref
+from rpcq.messages import BinaryExecutableResponse, ParameterAref
 
 from pyquil.parser import parse
 from pyquil import Program, get_qc
@@ -244,6 +244,65 @@ def parse_expression(expression):
     return parse(f"RZ({expression}) 0")[0].params[0]
 
 
+def test_run_submits_and_wait_collects(mock_qpu):
+    calls = []
+
+    class MockClient:
+        def call(self, method_name, *args, **kwargs):
+            calls.append((method_name, args, kwargs))
+            if method_name == "execute_qpu_request":
+                return "job-id"
+            assert method_name == "get_buffers"
+            return {
+                "q0": {"data": np.ones(10, dtype=np.int8).tobytes(), "dtype": "int8", "shape": [10]}
+            }
+
+    mock_qpu._client = MockClient()
+    mock_qpu.load(BinaryExecutableResponse(program="", ro_sources=[(0, 0)]))
+
+    # run() only queues the job; results are collected by wait().
+    mock_qpu.run()
+    assert [c[0] for c in calls] == ["execute_qpu_request"]
+
+    mock_qpu.wait()
+    assert calls[1] == ("get_buffers", ("job-id",), {"wait": True})
+    assert mock_qpu.status == "done"
+    assert mock_qpu.read_memory(region_name="ro").shape == (10, 1)
+
+
+def test_run_warns_when_previous_job_not_waited_on(mock_qpu):
+    job_ids = iter(["job-1", "job-2"])
+
+    class MockClient:
+        def call(self, method_name, *args, **kwargs):
+            assert method_name == "execute_qpu_request"
+            return next(job_ids)
+
+    mock_qpu._client = MockClient()
+    mock_qpu.load(BinaryExecutableResponse(program="", ro_sources=[(0, 0)]))
+    mock_qpu.run()
+    assert mock_qpu._job_id == "job-1"
+
+    with pytest.warns(UserWarning, match="job-1"):
+        mock_qpu.run()
+    assert mock_qpu._job_id == "job-2"
+
+
+def test_wait_forgets_failed_job(mock_qpu):
+    class MockClient:
+        def call(self, method_name, *args, **kwargs):
+            if method_name == "execute_qpu_request":
+                return "job-id"
+            raise RuntimeError("job failed")
+
+    mock_qpu._client = MockClient()
+    mock_qpu.load(BinaryExecutableResponse(program="", ro_sources=[(0, 0)]))
+    mock_qpu.run()
+    with pytest.raises(RuntimeError, match="job failed"):
+        mock_qpu.wait()
+    assert mock_qpu._job_id is None
+
+
 def test_run_expects_executable(qvm, qpu_compiler):
     # https://github.com/rigetti/pyquil/issues/740
 
@@ -75,6 +75,7 @@ from pyquil.quil import (
     merge_with_pauli_noise,
     address_qubits,
     get_classical_addresses_from_program,
+    percolate_declares,
     Pragma,
     validate_protoquil,
     validate_supported_quil,
@@ -1105,6 +1106,28 @@ def test_get_classical_addresses_from_quil_program():
     assert get_classical_addresses_from_program(p) == {"ro": [1]}
 
 
+def test_percolate_declares():
+    p = Program(
+        "DEFGATE FOO:\n    0, 1\n    1, 0\n",
+        "MOVE theta[0] 0.5",
+        "DECLARE ro BIT[1]",
+        "RX(theta) 0",
+        "DECLARE theta REAL",
+        "MEASURE 0 ro[0]",
+    )
+    percolated = percolate_declares(p)
+    assert percolated.out() == (
+        "DEFGATE FOO:\n    0, 1\n    1, 0\n\n"
+        "DECLARE ro BIT[1]\n"
+        "DECLARE theta REAL[1]\n"
+        "MOVE theta[0] 0.5\n"
+        "RX(theta[0]) 0\n"
+        "MEASURE 0 ro[0]\n"
+    )
+    assert percolated is not p
+    assert len(p) == 5
+
+
 def test_pragma_with_placeholders():
     q = QubitPlaceholder()
     q2 = QubitPlaceholder()
@@ -1,12 +1,18 @@
 import numpy as np
 import pytest
+import requests_mock
 
 from rpcq.messages import PyQuilExecutableResponse
 
 from pyquil import Program
 from pyquil.api import ForestConnection, QVM
 from pyquil.api._compiler import _extract_program_from_pyquil_executable_response
-from pyquil.gates import MEASURE, X, CNOT, H
+from pyquil.api._qvm import (
+    QVMVersionMismatch,
+    _get_cached_classical_addresses,
+    check_qvm_version,
+)
+from pyquil.gates import MEASURE, X, CNOT, H, RX
 from pyquil.quilbase import Declare, MemoryReference
 
 
@@ -85,3 +91,74 @@ def test_qvm_version(forest: ForestConnection):
         return True
 
     assert is_a_version_string(version)
+
+
+def test_cached_classical_addresses():
+    p = Program(Declare("ro", "BIT", 2), X(0), MEASURE(0, MemoryReference("ro", 1)))
+    assert _get_cached_classical_addresses(p) == {"ro": [1]}
+
+    cached = p._classical_addresses
+    assert _get_cached_classical_addresses(p) == {"ro": [1]}
+    assert p._classical_addresses is cached
+
+    # Modifying the program invalidates the cache.
+    p += MEASURE(1, MemoryReference("ro", 0))
+    assert _get_cached_classical_addresses(p) == {"ro": [0, 1]}
+
+    # So does appending to the synthesized instruction list in place.
+    p = Program(Declare("ro", "BIT", 2), MEASURE(0, MemoryReference("ro", 0)))
+    assert _get_cached_classical_addresses(p) == {"ro": [0]}
+    p.instructions.append(MEASURE(1, MemoryReference("ro", 1)))
+    assert _get_cached_classical_addresses(p) == {"ro": [0, 1]}
+
+    # Programs without the cache attribute, e.g. unpickled from an earlier pyQuil, still work.
+    del p._classical_addresses
+    assert _get_cached_classical_addresses(p) == {"ro": [0, 1]}
+
+    with pytest.raises(TypeError):
+        _get_cached_classical_addresses("MEASURE 0 ro[0]")
+
+
+def test_qvm_version_checked_once_per_connection():
+    connection = ForestConnection(sync_endpoint="http://mock-qvm:5000")
+    with requests_mock.Mocker() as m:
+        m.post("http://mock-qvm:5000", text="1.17.0 [abc123]")
+        QVM(connection=connection)
+        QVM(connection=connection)
+        assert m.call_count == 1
+
+        connection._invalidate_qvm_version_cache()
+        QVM(connection=connection)
+        assert m.call_count == 2
+
+
+def test_check_qvm_version():
+    check_qvm_version("1.17.0")
+    check_qvm_version("1.17.0-rc1")
+
+    with pytest.raises(QVMVersionMismatch):
+        check_qvm_version("1.7.9")
+    with pytest.raises(QVMVersionMismatch):
+        check_qvm_version("not-a-version")
+
+
+def test_augment_program_with_memory_values():
+    connection = ForestConnection(sync_endpoint="http://mock-qvm:5000")
+    with requests_mock.Mocker() as m:
+        m.post("http://mock-qvm:5000", text="1.17.0 [abc123]")
+        qvm = QVM(connection=connection)
+
+    p = Program(X(0), Declare("theta", "REAL", 2), RX(MemoryReference("theta", 1), 0))
+    qvm.load(p)
+    qvm.write_memory(region_name="theta", value=[0.5, 1.5])
+    qvm.write_memory(region_name="theta", value=2.5, offset=1)
+
+    augmented = qvm.augment_program_with_memory_values(p)
+    assert augmented.out() == (
+        "DECLARE theta REAL[2]\n"
+        "MOVE theta[0] 0.5\n"
+        "MOVE theta[1] 2.5\n"
+        "X 0\n"
+        "RX(theta[1]) 0\n"
+    )
+    assert len(p) == 3
@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 import itertools
+import struct
 
 from pyquil.wavefunction import (
     get_bitstring_from_index,
@@ -47,6 +48,20 @@ def test_ground_state():
     assert ground.amplitudes[0] == 1.0
 
 
+def test_from_bit_packed_string(wvf):
+    # The QVM sends each amplitude as a big-endian double for the real part followed by one for
+    # the imaginary part.
+    packed = b"".join(
+        struct.pack(">dd", amplitude.real, amplitude.imag) for amplitude in wvf.amplitudes
+    )
+    unpacked = Wavefunction.from_bit_packed_string(packed)
+    np.testing.assert_array_equal(unpacked.amplitudes, wvf.amplitudes)
+
+    # The amplitudes remain writable.
+    unpacked[0] = 0.0
+    assert unpacked.amplitudes[0] == 0.0
+
+
 def test_octet_bits():
     assert [0, 0, 0, 0, 0, 0, 0, 0] == _octet_bits(0b0)
     assert [1, 0, 0, 0, 0, 0, 0, 0] == _octet_bits(0b1)
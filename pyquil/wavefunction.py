@@ -17,7 +17,6 @@
 Module containing the Wavefunction object and methods for working with wavefunctions.
 """
 import itertools
-import struct
 import warnings
 from typing import Dict, Iterator, List, Optional, Sequence, cast
 
@@ -83,14 +82,14 @@ class Wavefunction(object):
         """
         num_octets = len(coef_string)
 
-        # Parse the wavefunction
-        wf = np.zeros(num_octets // OCTETS_PER_COMPLEX_DOUBLE, dtype=np.cfloat)
-        for i, p in enumerate(range(0, num_octets, OCTETS_PER_COMPLEX_DOUBLE)):
-            re_be = coef_string[p : p + OCTETS_PER_DOUBLE_FLOAT]
-            im_be = coef_string[p + OCTETS_PER_DOUBLE_FLOAT : p + OCTETS_PER_COMPLEX_DOUBLE]
-            re = struct.unpack(">d", re_be)[0]
-            im = struct.unpack(">d", im_be)[0]
-            wf[i] = complex(re, im)
+        # Parse the wavefunction. Each amplitude is packed as a big-endian double for the real part
+        # followed by one for the imaginary part, which is exactly the memory layout of a
+        # big-endian complex128, so we can view the buffer directly rather than unpacking each
+        # amplitude in Python. The single copy made by astype() converts to native byte order
+        # and gives us a writable array.
+        wf = np.frombuffer(
+            coef_string, dtype=">c16", count=num_octets // OCTETS_PER_COMPLEX_DOUBLE
+        ).astype(np.cfloat)
 
         return Wavefunction(wf)
 
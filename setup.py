@@ -82,6 +82,7 @@ setup(
         "immutables==0.6",
     ],
     extras_require={"latex": ["ipython"],
+                    "orjson": ["orjson"],
                     "tutorials": ["forest-benchmarking", "jupyter", "matplotlib", "seaborn",
                                   "pandas", "scipy", "tqdm"]},
     keywords="quantum quil programming hybrid",